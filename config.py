@@ -1,5 +1,6 @@
 """Configuration constants for PRIP (Protein Residue Interaction Parser)."""
 
+import re
 from typing import Final
 
 # Color scheme
@@ -17,6 +18,13 @@ FONT_SIZE_NORMAL: Final[int] = 12
 FONT_SIZE_SMALL: Final[int] = 10
 FONT_SIZE_TINY: Final[int] = 8
 
+# Font tuples shared by widget defaults and page builders
+FONT_NORMAL: Final[tuple] = (FONT_NAME, FONT_SIZE_NORMAL, "normal")
+FONT_SMALL: Final[tuple] = (FONT_NAME, FONT_SIZE_SMALL, "normal")
+FONT_TINY: Final[tuple] = (FONT_NAME, FONT_SIZE_TINY, "normal")
+FONT_MEDIUM_BOLD: Final[tuple] = (FONT_NAME, FONT_SIZE_MEDIUM, "bold")
+FONT_LARGE_BOLD: Final[tuple] = (FONT_NAME, FONT_SIZE_LARGE, "bold")
+
 # Application settings
 WINDOW_WIDTH: Final[int] = 1200
 WINDOW_HEIGHT: Final[int] = 750
@@ -27,9 +35,35 @@ STARTING_RULES: Final[int] = 5
 DEFAULT_RULES_FILE: Final[str] = "saved_rules.json"
 
 # Accepted amino acid abbreviations (3-letter and 1-letter codes)
-ACCEPTED_AMINO_ACIDS: Final[tuple] = (
+ACCEPTED_AMINO_ACIDS: Final[frozenset[str]] = frozenset((
     'ALA', 'A', 'ARG', 'R', 'ASN', 'N', 'ASP', 'D', 'CYS', 'C', 
     'GLU', 'E', 'GLN', 'Q', 'GLY', 'G', 'HIS', 'H', 'ILE', 'I',
     'LEU', 'L', 'LYS', 'K', 'MET', 'M', 'PHE', 'F', 'PRO', 'P', 
     'SER', 'S', 'THR', 'T', 'TRP', 'W', 'TYR', 'Y', 'VAL', 'V'
+))
+
+# 3-letter to 1-letter code map, built once at import for O(1) lookups
+THREE_TO_ONE: Final[dict[str, str]] = {
+    'ALA': 'A', 'ARG': 'R', 'ASN': 'N', 'ASP': 'D', 'CYS': 'C',
+    'GLU': 'E', 'GLN': 'Q', 'GLY': 'G', 'HIS': 'H', 'ILE': 'I',
+    'LEU': 'L', 'LYS': 'K', 'MET': 'M', 'PHE': 'F', 'PRO': 'P',
+    'SER': 'S', 'THR': 'T', 'TRP': 'W', 'TYR': 'Y', 'VAL': 'V'
+}
+
+# Every accepted code (3-letter or 1-letter) mapped to its canonical 1-letter code
+AA_ONE_TO_ONE: Final[dict[str, str]] = {**THREE_TO_ONE, **{one: one for one in THREE_TO_ONE.values()}}
+
+# Integer index of each canonical 1-letter code; non-standard residues map to -1
+CODE_INDEX: Final[dict[str, int]] = {code: index for index, code in enumerate(sorted(set(AA_ONE_TO_ONE.values())))}
+
+# CODE_INDEX value of every accepted code, so canonicalizing and indexing is one lookup
+ABBREV_CODE_INDEX: Final[dict[str, int]] = {code: CODE_INDEX[one] for code, one in AA_ONE_TO_ONE.items()}
+
+# Whole comma-separated group of accepted codes (case-insensitive, blank items allowed),
+# so a valid group string is checked with a single fullmatch instead of a per-code loop.
+# ASCII-only case folding, so look-alikes such as the Kelvin sign do not match 'K'.
+_AA_ALTERNATION: Final[str] = '|'.join(sorted(ACCEPTED_AMINO_ACIDS, key=lambda code: (-len(code), code)))
+AA_GROUP_RE: Final[re.Pattern] = re.compile(
+    rf'\s*(?:(?:{_AA_ALTERNATION})\s*)?(?:,\s*(?:(?:{_AA_ALTERNATION})\s*)?)*',
+    re.IGNORECASE | re.ASCII
 )
@@ -1,12 +1,14 @@
 """GUI module for PRIP - handles all Tkinter widget creation and management."""
 
-from typing import Optional, List, Callable, Any
-from tkinter import *
-from tkinter import ttk
+from typing import Optional, List, Dict, Set, Callable, Any
+from tkinter import (
+    Tk, Misc, Frame, Button, Label, Canvas, Scrollbar, Text, Entry,
+    BOTTOM, INSERT, END
+)
 
 from config import (
-    WHITEGRAY, WHITE, LIGHTBLUE, DARKBLUE, BLACK, FONT_NAME,
-    FONT_SIZE_NORMAL, WINDOW_WIDTH, WINDOW_HEIGHT
+    WHITEGRAY, WHITE, LIGHTBLUE, DARKBLUE, BLACK, FONT_NORMAL,
+    WINDOW_WIDTH, WINDOW_HEIGHT
 )
 
 # ---------------------------- GUI / Widget skeletons ------------------------------- #
@@ -21,25 +23,53 @@ class GuiMaster:
         self.window.config(padx=10, pady=5, bg=WHITEGRAY)
         self.window.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         
-        # Configure grid weights
-        for i in range(3):
-            self.window.columnconfigure(i, weight=1)
-        self.window.rowconfigure(1, weight=3)
-        self.window.rowconfigure(2, weight=1)
-        self.window.rowconfigure(3, weight=1)
+        # Pages share the single window cell and are switched with tkraise
+        self.window.rowconfigure(0, weight=1)
+        self.window.columnconfigure(0, weight=1)
+        self.pages: Dict[str, Frame] = {}
+        self.built_pages: Set[str] = set()
+        self.current_page: Optional[str] = None
+        for page_name in ('main', 'criteria', 'results'):
+            page = Frame(master=self.window, bg=WHITEGRAY)
+            page.grid(row=0, column=0, sticky='nsew')
+            self.pages[page_name] = page
+
+    def show_page(self, page_name: str, build_page: Callable[[Frame], None]) -> Frame:
+        """Raise a page above the others, building its widgets on the first visit.
+        
+        Args:
+            page_name: Key of the page in self.pages
+            build_page: Function that creates the page's static widgets
+            
+        Returns:
+            The page frame
+        """
+        page = self.pages[page_name]
+        if page_name not in self.built_pages:
+            build_page(page)
+            self.built_pages.add(page_name)
+        page.tkraise()
+        self.current_page = page_name
+        return page
 
-    def clear_page(self) -> None:
-        """Destroy all widgets in the main window."""
-        for widget in self.window.winfo_children():
+    def clear_page(self, page_parent: Optional[Misc] = None) -> None:
+        """Destroy all widgets in a container, or in the main window by default.
+        
+        Args:
+            page_parent: Container whose children are destroyed
+        """
+        parent = self.window if page_parent is None else page_parent
+        for widget in parent.winfo_children():
             widget.destroy()
 
     def create_button(
         self, 
         btn_text: str, 
         btn_command: Callable, 
+        btn_parent: Optional[Misc] = None, 
         btn_width: int = 22, 
         btn_height: int = 2, 
-        btn_font: tuple = (FONT_NAME, FONT_SIZE_NORMAL, "normal"), 
+        btn_font: tuple = FONT_NORMAL, 
         btn_columnspan: int = 1,
         btn_fit: str = 'grid', 
         btn_column: int = 0, 
@@ -54,6 +84,7 @@ class GuiMaster:
         Args:
             btn_text: Button label text
             btn_command: Function to call when button is clicked
+            btn_parent: Parent widget (defaults to the main window)
             btn_width: Button width in characters
             btn_height: Button height in lines
             btn_font: Tuple of (font_family, size, style)
@@ -69,7 +100,8 @@ class GuiMaster:
         Returns:
             The created Button widget
         """
-        self.btn = Button(
+        btn = Button(
+            master=btn_parent, 
             text=btn_text, 
             width=btn_width, 
             height=btn_height, 
@@ -78,7 +110,7 @@ class GuiMaster:
             state=btn_state
         )
         if btn_fit == 'grid':
-            self.btn.grid(
+            btn.grid(
                 column=btn_column, 
                 row=btn_row, 
                 sticky=btn_sticky, 
@@ -86,93 +118,112 @@ class GuiMaster:
                 pady=add_pady, 
                 columnspan=btn_columnspan
             )
-        return self.btn
+        return btn
 
-    def create_label(self, lbl_text, lbl_bg=WHITEGRAY, lbl_fg=BLACK, lbl_font=(FONT_NAME, 12, "normal"), lbl_wraplength=None, lbl_justify="center", 
+    def create_label(self, lbl_text, lbl_parent=None, lbl_bg=WHITEGRAY, lbl_fg=BLACK, lbl_font=FONT_NORMAL, lbl_wraplength=None, lbl_justify="center", 
                      lbl_fit='grid', lbl_column=0, lbl_row=0, lbl_columnspan=1, lbl_sticky=None, add_padx=1, add_pady=1):
-        self.lbl = Label(text=lbl_text, bg=lbl_bg, fg=lbl_fg, font=lbl_font, wraplength=lbl_wraplength, justify=lbl_justify)
+        lbl = Label(master=lbl_parent, text=lbl_text, bg=lbl_bg, fg=lbl_fg, font=lbl_font, wraplength=lbl_wraplength, justify=lbl_justify)
         if lbl_fit == 'grid':
-            self.lbl.grid(column=lbl_column, row=lbl_row, columnspan=lbl_columnspan, stick=lbl_sticky, padx=add_padx, pady=add_pady)
+            lbl.grid(column=lbl_column, row=lbl_row, columnspan=lbl_columnspan, stick=lbl_sticky, padx=add_padx, pady=add_pady)
         elif lbl_fit == 'pack':
             pass
+        return lbl
 
-    def create_cbo_box(self, cbo_parent, cbo_width=10, cbo_state='readonly', cbo_dropdown_values=['NA'], cbo_default_val=0,
+    def create_cbo_box(self, cbo_parent, cbo_width=10, cbo_state='readonly', cbo_dropdown_values=('NA',), cbo_default_val=0,
                        cbo_fit='grid', cbo_column=0, cbo_row=0, cbo_sticky=None):
-        self.cbo_box = ttk.Combobox(master=cbo_parent, width=cbo_width, state=cbo_state)
-        self.cbo_box['values'] = cbo_dropdown_values
-        self.cbo_box.set(cbo_default_val)
+        # ttk is loaded on first use; the main page only needs it once a file is open
+        from tkinter import ttk
+        cbo_box = ttk.Combobox(master=cbo_parent, width=cbo_width, state=cbo_state)
+        self.update_cbo_box(cbo_box, cbo_dropdown_values, cbo_default_val)
         if cbo_fit == 'grid':
-            self.cbo_box.grid(column=cbo_column, row=cbo_row, sticky=cbo_sticky)
+            cbo_box.grid(column=cbo_column, row=cbo_row, sticky=cbo_sticky)
         elif cbo_fit == 'pack':
             pass
-        return self.cbo_box
+        return cbo_box
+
+    def update_cbo_box(self, cbo_box, cbo_dropdown_values, cbo_default_val):
+        # Only rewrite the Tcl list of choices when they actually changed
+        dropdown_values = tuple(cbo_dropdown_values)
+        if getattr(cbo_box, '_last_values', None) != dropdown_values:
+            cbo_box['values'] = dropdown_values
+            cbo_box._last_values = dropdown_values
+        cbo_box.set(cbo_default_val)
 
     def create_frame(self, frm_parent, frm_bg=WHITE, frm_width=500, frm_height=320, frm_fit='grid', frm_row=0, frm_column=0, frm_columnspan=1, 
                      frm_sticky = None, add_padx=1, add_pady=1, frm_grid_propagate=False, frm_rowconfigure=0, frm_columnconfigure=0):
-        self.frm = Frame(master=frm_parent)
-        self.frm.config(bg=frm_bg, width=frm_width, height=frm_height)
+        frm = Frame(master=frm_parent)
+        frm.config(bg=frm_bg, width=frm_width, height=frm_height)
         if frm_fit == 'grid':
-            self.frm.grid(row=frm_row, column=frm_column, columnspan=frm_columnspan, sticky=frm_sticky, padx=add_padx, pady=add_pady)
-            self.frm.grid_propagate(frm_grid_propagate)
-            self.frm.rowconfigure(frm_row, weight=frm_rowconfigure)
-            self.frm.columnconfigure(frm_column, weight=frm_columnconfigure)
+            frm.grid(row=frm_row, column=frm_column, columnspan=frm_columnspan, sticky=frm_sticky, padx=add_padx, pady=add_pady)
+            frm.grid_propagate(frm_grid_propagate)
+            frm.rowconfigure(frm_row, weight=frm_rowconfigure)
+            frm.columnconfigure(frm_column, weight=frm_columnconfigure)
         elif frm_fit == 'pack':
-            self.frm.pack(side='left', fill='both', expand=True)
-            # self.frm.pack_propagate(frm_grid_propagate)
-        return self.frm
+            frm.pack(side='left', fill='both', expand=True)
+            # frm.pack_propagate(frm_grid_propagate)
+        return frm
     
     def create_canvas(self, can_parent, can_bg=WHITE, can_width=500, can_height=320, can_fit='grid', can_row=0, can_column=0, can_columnspan=1,
                       can_sticky=None, add_padx=1, add_pady=1, can_borderwidth=0):
-        self.canv = Canvas(master=can_parent, borderwidth=can_borderwidth)
+        canv = Canvas(master=can_parent, borderwidth=can_borderwidth)
         if can_fit == 'grid':
-            self.canv.grid(row=can_row, column=can_column, columnspan=can_columnspan, sticky=can_sticky, padx=add_padx, pady=add_pady)
-            self.canv.grid_propagate(False)
+            canv.grid(row=can_row, column=can_column, columnspan=can_columnspan, sticky=can_sticky, padx=add_padx, pady=add_pady)
+            canv.grid_propagate(False)
         elif can_fit == 'pack':
-            self.canv.pack(side="left", fill="both", expand=True)
-            # self.canv.pack_propagate(False)
-        return self.canv
+            canv.pack(side="left", fill="both", expand=True)
+            # canv.pack_propagate(False)
+        return canv
 
     def create_scrollbar(self, scr_parent, scr_orient='vertical', scr_fit='grid', scr_row=0, scr_column=0, scr_sticky='nse', scr_command=None):
-        self.scrl_bar = Scrollbar(master=scr_parent, orient=scr_orient, command=scr_command)
+        scrl_bar = Scrollbar(master=scr_parent, orient=scr_orient, command=scr_command)
         if scr_fit == 'grid':
-            self.scrl_bar.grid(row=scr_row, column=scr_column, stick=scr_sticky)
+            scrl_bar.grid(row=scr_row, column=scr_column, stick=scr_sticky)
         elif scr_fit == 'pack':
-            self.scrl_bar.pack(side="right", fill="y")
-        return self.scrl_bar
+            scrl_bar.pack(side="right", fill="y")
+        return scrl_bar
     
-    def create_text(self, txt_parent, txt_text='', txt_yscrollcommand=None, txt_font=(FONT_NAME, 12, "normal"), txt_fit='grid', txt_row=0, txt_column=0, 
+    def create_text(self, txt_parent, txt_text='', txt_yscrollcommand=None, txt_font=FONT_NORMAL, txt_fit='grid', txt_row=0, txt_column=0, 
                     txt_sticky='w', txt_columnspan=1):
-        self.text = Text(master=txt_parent, font=txt_font, yscrollcommand=txt_yscrollcommand)
-        self.text.insert(INSERT, txt_text)
-        self.text.config(state='disabled') 
+        text = Text(master=txt_parent, font=txt_font, yscrollcommand=txt_yscrollcommand)
+        text.insert(INSERT, txt_text)
+        text.config(state='disabled') 
         if txt_fit == 'grid':
-            self.text.grid(row=txt_row, column=txt_column, sticky=txt_sticky, columnspan=txt_columnspan)
+            text.grid(row=txt_row, column=txt_column, sticky=txt_sticky, columnspan=txt_columnspan)
         elif txt_fit == 'pack':
-            self.text.pack(anchor='center')
-        return self.text
+            text.pack(anchor='center')
+        return text
+
+    def set_text(self, text_widget, txt_text=''):
+        text_widget.config(state='normal')
+        text_widget.delete('1.0', END)
+        text_widget.insert(INSERT, txt_text)
+        text_widget.config(state='disabled')
     
     def reweight_rows_cols(self, row_weights, col_weights):
-        for row in range(len(row_weights)):
-            self.window.rowconfigure(index=row, weight=row_weights[row])
-        for col in range(len(col_weights)):
-            self.window.columnconfigure(index=col, weight=col_weights[col])
+        self.reweight_frame_rows_cols(self.window, row_weights, col_weights)
     
     def reweight_frame_rows_cols(self, rew_frame, row_weights, col_weights):
         if row_weights != None:
-            for row in range(len(row_weights)):
-                rew_frame.rowconfigure(index=row, weight=row_weights[row])
+            self._configure_grid_weights(rew_frame, 'rowconfigure', row_weights)
         if col_weights != None:
-            for col in range(len(col_weights)):
-                rew_frame.columnconfigure(index=col, weight=col_weights[col])
+            self._configure_grid_weights(rew_frame, 'columnconfigure', col_weights)
+
+    def _configure_grid_weights(self, rew_frame, grid_option, weights):
+        # Group indices by weight so each distinct weight costs one Tcl call
+        indices_by_weight = {}
+        for index, weight in enumerate(weights):
+            indices_by_weight.setdefault(weight, []).append(index)
+        for weight, indices in indices_by_weight.items():
+            rew_frame.tk.call('grid', grid_option, str(rew_frame), tuple(indices), '-weight', weight)
     
-    def create_entry(self, ety_parent, ety_bg=WHITE, ety_fg=BLACK, ety_font=(FONT_NAME, 12, "normal"), ety_justify='left', 
+    def create_entry(self, ety_parent, ety_text='', ety_bg=WHITE, ety_fg=BLACK, ety_font=FONT_NORMAL, ety_justify='left', 
                      ety_fit='grid', ety_row=0, ety_column=0, ety_sticky=None, add_padx=1, add_pady=1, ety_width=16, ety_pack=BOTTOM):
-        self.entry_string = StringVar()
-        self.entry = Entry(master=ety_parent, bg=ety_bg, fg=ety_fg, textvariable=self.entry_string, font=ety_font, justify=ety_justify, width=ety_width)
+        # No textvariable: callers read entries with get(), so a Tcl variable trace per keystroke is wasted
+        entry = Entry(master=ety_parent, bg=ety_bg, fg=ety_fg, font=ety_font, justify=ety_justify, width=ety_width)
+        if ety_text != '':
+            entry.insert(0, ety_text)
         if ety_fit == 'grid':
-            self.entry.grid(row=ety_row, column=ety_column, sticky=ety_sticky, padx=add_padx, pady=add_pady)
-            self.entry.grid_propagate(False)
+            entry.grid(row=ety_row, column=ety_column, sticky=ety_sticky, padx=add_padx, pady=add_pady)
         elif ety_fit == 'pack':
-            self.entry.pack(side=ety_pack)
-            self.entry.pack_propagate(False)
-        return self.entry
\ No newline at end of file
+            entry.pack(side=ety_pack)
+        return entry
\ No newline at end of file
@@ -1,67 +1,137 @@
 """Main module for PRIP (Protein Residue Interaction Parser) application."""
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, TYPE_CHECKING
 import logging
 
-from tkinter import *
-from tkinter import filedialog, messagebox
-from tkinter import ttk
-from Bio.PDB import PDBParser
+from tkinter import Frame, Button, Canvas, Entry
 
-from prip_parser import ProteinParser
-from prip_parsecriteria import ParserCriteria
 from prip_gui import GuiMaster
 from config import (
-    WHITEGRAY, WHITE, LIGHTBLUE, DARKBLUE, BLACK, FONT_NAME,
-    FONT_SIZE_LARGE, FONT_SIZE_MEDIUM, FONT_SIZE_SMALL, FONT_SIZE_TINY, FONT_SIZE_NORMAL,
+    WHITEGRAY, WHITE, LIGHTBLUE, DARKBLUE, BLACK,
+    FONT_SMALL, FONT_TINY, FONT_MEDIUM_BOLD, FONT_LARGE_BOLD,
     MAX_RULES
 )
 
+if TYPE_CHECKING:
+    from prip_parser import ProteinParser
+    from prip_parsecriteria import ParserCriteria
+
 # Set up logging
-logging.basicConfig(level=logging.INFO)
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Parses run on a single worker thread so the Tk event loop stays responsive
+parse_executor = ThreadPoolExecutor(max_workers=1)
+PARSE_POLL_MS = 50
+SPINNER_FRAMES = '|/-\\'
+
+# ---------------------------- Application state ------------------------------- #
+
+class AppState:
+    """Holds the parser objects, constructing each one on first access.
+
+    ProteinParser pulls in pandas and Biopython, so building it before the
+    first paint would delay the main page. Both objects are instead created
+    lazily and warmed up once the event loop is idle.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the state without constructing any parser objects."""
+        self._protein_parser: Optional["ProteinParser"] = None
+        self._parse_criteria: Optional["ParserCriteria"] = None
+        self.parse_future: Optional[Future] = None
+
+    @property
+    def protein_parser(self) -> "ProteinParser":
+        """Return the ProteinParser, creating it on first use."""
+        if self._protein_parser is None:
+            from prip_parser import ProteinParser
+            self._protein_parser = ProteinParser()
+        return self._protein_parser
+
+    @property
+    def parse_criteria(self) -> "ParserCriteria":
+        """Return the ParserCriteria, creating it on first use."""
+        if self._parse_criteria is None:
+            from prip_parsecriteria import ParserCriteria
+            self._parse_criteria = ParserCriteria()
+        return self._parse_criteria
+
+    @property
+    def protein_file_loaded(self) -> bool:
+        """Whether a protein file has been selected, without forcing parser construction."""
+        return self._protein_parser is not None and bool(self._protein_parser.protein_file)
+
+    @property
+    def parse_in_progress(self) -> bool:
+        """Whether a background parse has been started and not yet finished."""
+        return self.parse_future is not None and not self.parse_future.done()
+
+    def warm_up(self) -> None:
+        """Construct both parser objects ahead of the first user action."""
+        self.protein_parser
+        self.parse_criteria
+
 # ---------------------------- Page Navigation and Construction ------------------------------- #
 
-def goto_criteria() -> None:
-    """Navigate to the criteria configuration page."""
-    gui.clear_page()
+# Widgets that page refreshes update in place, keyed by role
+page_widgets: Dict[str, Any] = {}
+
+# Per-column layout of a rule row: name, group 1, group 2, distance
+RULE_ENTRY_COLUMN_KW: tuple = (
+    {'ety_column': 0, 'add_padx': (10, 0), 'ety_width': 15},
+    {'ety_column': 1, 'add_padx': (60, 20), 'ety_width': 30},
+    {'ety_column': 2, 'add_padx': (10, 20), 'ety_width': 30},
+    {'ety_column': 3, 'add_padx': (20, 10), 'ety_width': 5}
+)
+
+def build_criteria_page(page: Frame) -> None:
+    """Create the static widgets of the criteria page.
+    
+    Args:
+        page: The persistent frame hosting the criteria page
+    """
     gui.create_button(
+        btn_parent=page, 
         btn_text="Back", 
-        btn_command=lambda: on_back_from_criteria(), 
+        btn_command=on_back_from_criteria, 
         btn_width=10, 
         add_padx=(10), 
         add_pady=(10), 
         btn_column=0, 
         btn_row=0, 
         btn_sticky='nw', 
-        btn_font=(FONT_NAME, FONT_SIZE_TINY, 'normal'), 
+        btn_font=FONT_TINY, 
         btn_height=1
     )
     gui.create_label(
+        lbl_parent=page, 
         lbl_text="Parse criteria", 
-        lbl_font=(FONT_NAME, FONT_SIZE_MEDIUM, "bold"), 
+        lbl_font=FONT_MEDIUM_BOLD, 
         lbl_justify="center", 
         lbl_column=0, 
         lbl_row=0, 
         lbl_columnspan=4, 
         add_pady=(30, 30)
     )
-    add_rule_btn = gui.create_button(
+    page_widgets['add_rule_btn'] = gui.create_button(
+        btn_parent=page, 
         btn_text="Add rule", 
-        btn_command=lambda: add_rule(rules_frame, add_rule_btn), 
+        btn_command=on_add_rule, 
         btn_column=0, 
         btn_row=1, 
         btn_width=16, 
         btn_sticky='ne', 
         add_pady=(10), 
-        btn_height=1, 
-        btn_state=parse_criteria.can_add_rule
+        btn_height=1
     )
     gui.create_button(
+        btn_parent=page, 
         btn_text="Import", 
-        btn_command=lambda: on_import_rules(), 
+        btn_command=on_import_rules, 
         btn_column=1, 
         btn_row=1, 
         btn_width=16, 
@@ -70,8 +140,9 @@ def goto_criteria() -> None:
         btn_height=1
     )
     gui.create_button(
+        btn_parent=page, 
         btn_text="Save", 
-        btn_command=lambda: on_save_rules(), 
+        btn_command=on_save_rules, 
         btn_column=2, 
         btn_row=1, 
         btn_width=16, 
@@ -80,6 +151,7 @@ def goto_criteria() -> None:
         btn_height=1
     )
     gui.create_label(
+        lbl_parent=page, 
         lbl_text='Rule name', 
         lbl_column=0, 
         lbl_row=2, 
@@ -88,6 +160,7 @@ def goto_criteria() -> None:
         add_pady=(30, 0)
     )
     gui.create_label(
+        lbl_parent=page, 
         lbl_text='Group 1', 
         lbl_column=1, 
         lbl_row=2, 
@@ -96,6 +169,7 @@ def goto_criteria() -> None:
         add_pady=(30, 0)
     )
     gui.create_label(
+        lbl_parent=page, 
         lbl_text='Group 2', 
         lbl_column=2, 
         lbl_row=2, 
@@ -104,6 +178,7 @@ def goto_criteria() -> None:
         add_pady=(30, 0)
     )
     gui.create_label(
+        lbl_parent=page, 
         lbl_text='Distance', 
         lbl_column=3, 
         lbl_row=2, 
@@ -111,8 +186,8 @@ def goto_criteria() -> None:
         add_padx=(10), 
         add_pady=(30, 0)
     )
-    rules_frame = gui.create_frame(
-        frm_parent=gui.window, 
+    page_widgets['rules_frame'] = gui.create_frame(
+        frm_parent=page, 
         frm_bg=WHITE, 
         frm_row=3, 
         frm_column=0, 
@@ -120,170 +195,300 @@ def goto_criteria() -> None:
         frm_sticky='new', 
         frm_height=550
     )
-    gui.reweight_rows_cols(row_weights=[2, 1, 1, 7], col_weights=[1, 2, 2, 1])
+    gui.reweight_frame_rows_cols(rew_frame=page, row_weights=[2, 1, 1, 7], col_weights=[1, 2, 2, 1])
+    gui.reweight_frame_rows_cols(rew_frame=page_widgets['rules_frame'], row_weights=None, col_weights=[1, 2, 2, 1])
+
+def goto_criteria() -> None:
+    """Navigate to the criteria configuration page."""
+    gui.show_page('criteria', build_criteria_page)
+    rules_frame = page_widgets['rules_frame']
+    gui.clear_page(rules_frame)
+    # The rows about to be destroyed must not be read again by cache_rules
+    state.parse_criteria.reset_entry_widgets()
     initialize_rules(gui_frame=rules_frame)
-    gui.reweight_frame_rows_cols(rew_frame=rules_frame, row_weights=None, col_weights=[1, 2, 2, 1])
+    page_widgets['add_rule_btn'].config(state=state.parse_criteria.can_add_rule)
 
-def goto_mainpage() -> None:
-    """Navigate to the main page with file selection and run options."""
-    gui.canvas = Canvas(width=350, height=300, bg=WHITEGRAY, highlightthickness=0)
-    gui.canvas.grid(column=1, row=0)
-    gui.reweight_rows_cols(row_weights=[5, 2, 2, 1], col_weights=[1, 1, 1, 0])
+def build_mainpage(page: Frame) -> None:
+    """Create the static widgets of the main page.
+    
+    Args:
+        page: The persistent frame hosting the main page
+    """
+    spacer = Canvas(master=page, width=350, height=300, bg=WHITEGRAY, highlightthickness=0)
+    spacer.grid(column=1, row=0)
+    gui.reweight_frame_rows_cols(rew_frame=page, row_weights=[5, 2, 2, 1], col_weights=[1, 1, 1, 0])
     gui.create_label(
+        lbl_parent=page, 
         lbl_text="Protein Residue Interaction Parser", 
         lbl_bg=WHITEGRAY, 
         lbl_fg=LIGHTBLUE, 
-        lbl_font=(FONT_NAME, FONT_SIZE_LARGE, "bold"),
+        lbl_font=FONT_LARGE_BOLD,
         lbl_wraplength=400, 
         lbl_justify="center", 
         lbl_column=0, 
         lbl_row=0, 
         lbl_columnspan=3
     )
-    gui.create_button(
+    page_widgets['select_file_btn'] = gui.create_button(
+        btn_parent=page, 
         btn_text="Select File", 
-        btn_command=lambda: browse_files(), 
+        btn_command=browse_files, 
         btn_column=0, 
         btn_row=1, 
         btn_sticky='e'
     )
-    gui.create_button(
+    page_widgets['criteria_btn'] = gui.create_button(
+        btn_parent=page, 
         btn_text="Interaction criteria", 
-        btn_command=lambda: goto_criteria(), 
+        btn_command=goto_criteria, 
         btn_column=2, 
         btn_row=1, 
         btn_sticky='w'
     )
-    
-    if not protein_parser.protein_file:
-        display_filename = 'No file selected'
-        run_button_state = 'disable'
-    else:
-        display_filename = f'Opened: {protein_parser.protein_name}'
-        run_button_state = 'normal'
-        model_cbo_box = gui.create_cbo_box(
-            cbo_parent=gui.window, 
-            cbo_dropdown_values=protein_parser.model_list, 
-            cbo_column=0, 
-            cbo_row=2, 
-            cbo_sticky='e', 
-            cbo_default_val=protein_parser.selected_model
-        )
-        model_cbo_box.bind('<<ComboboxSelected>>', lambda event: protein_parser.update_model(model_cbo_box.get()))
-        gui.create_label(lbl_text='Model:', lbl_column=0, lbl_row=2)
-        chain_cbo_box = gui.create_cbo_box(
-            cbo_parent=gui.window, 
-            cbo_dropdown_values=protein_parser.chain_list, 
-            cbo_column=0, 
-            cbo_row=3, 
-            cbo_sticky='e', 
-            cbo_default_val=protein_parser.selected_chain
-        )
-        chain_cbo_box.bind('<<ComboboxSelected>>', lambda event: protein_parser.update_chain(chain_cbo_box.get()))
-        gui.create_label(lbl_text='Chain:', lbl_column=0, lbl_row=3)
-        
-    gui.create_label(
-        lbl_text=display_filename, 
+    page_widgets['filename_lbl'] = gui.create_label(
+        lbl_parent=page, 
+        lbl_text='No file selected', 
         lbl_fg=DARKBLUE, 
-        lbl_font=(FONT_NAME, FONT_SIZE_SMALL, "normal"), 
+        lbl_font=FONT_SMALL, 
         lbl_column=0, 
         lbl_row=4, 
         lbl_columnspan=3, 
         lbl_sticky='sw', 
         add_pady=(10, 0)
     )
-    gui.create_button(
+    page_widgets['run_btn'] = gui.create_button(
+        btn_parent=page, 
         btn_text="Run", 
-        btn_state=run_button_state, 
-        btn_command=lambda: run_and_goto_results(), 
+        btn_state='disable', 
+        btn_command=run_and_goto_results, 
         btn_column=1, 
         btn_row=1
     )
 
-def goto_results_page():
-    gui.clear_page()
-    results_frame = gui.create_frame(frm_parent=gui.window, frm_columnspan=3, frm_sticky="news", add_padx=(5), add_pady=(5, 0), frm_rowconfigure=1, frm_columnconfigure=1)
+def build_model_chain_selectors(page: Frame) -> None:
+    """Create the model and chain comboboxes once a file has been loaded.
+    
+    Args:
+        page: The persistent frame hosting the main page
+    """
+    model_cbo_box = gui.create_cbo_box(
+        cbo_parent=page, 
+        cbo_column=0, 
+        cbo_row=2, 
+        cbo_sticky='e'
+    )
+    model_cbo_box.bind('<<ComboboxSelected>>', lambda event: state.protein_parser.update_model(model_cbo_box.get()))
+    gui.create_label(lbl_parent=page, lbl_text='Model:', lbl_column=0, lbl_row=2)
+    chain_cbo_box = gui.create_cbo_box(
+        cbo_parent=page, 
+        cbo_column=0, 
+        cbo_row=3, 
+        cbo_sticky='e'
+    )
+    chain_cbo_box.bind('<<ComboboxSelected>>', lambda event: state.protein_parser.update_chain(chain_cbo_box.get()))
+    gui.create_label(lbl_parent=page, lbl_text='Chain:', lbl_column=0, lbl_row=3)
+    page_widgets['model_cbo_box'] = model_cbo_box
+    page_widgets['chain_cbo_box'] = chain_cbo_box
+
+def goto_mainpage() -> None:
+    """Navigate to the main page with file selection and run options."""
+    page = gui.show_page('main', build_mainpage)
+    
+    if not state.protein_file_loaded:
+        display_filename = 'No file selected'
+        run_button_state = 'disable'
+    else:
+        display_filename = f'Opened: {state.protein_parser.protein_name}'
+        run_button_state = 'disable' if state.parse_in_progress else 'normal'
+        if 'model_cbo_box' not in page_widgets:
+            build_model_chain_selectors(page)
+        gui.update_cbo_box(page_widgets['model_cbo_box'], state.protein_parser.model_list, state.protein_parser.selected_model)
+        gui.update_cbo_box(page_widgets['chain_cbo_box'], state.protein_parser.chain_list, state.protein_parser.selected_chain)
+        
+    page_widgets['filename_lbl'].config(text=display_filename)
+    page_widgets['run_btn'].config(state=run_button_state)
+    if state.parse_in_progress:
+        set_parse_controls_state('disable')
+
+def build_results_page(page: Frame) -> None:
+    """Create the static widgets of the results page.
+    
+    Args:
+        page: The persistent frame hosting the results page
+    """
+    results_frame = gui.create_frame(frm_parent=page, frm_columnspan=3, frm_sticky="news", add_padx=(5), add_pady=(5, 0), frm_rowconfigure=1, frm_columnconfigure=1)
     results_scrollbar = gui.create_scrollbar(scr_parent=results_frame, scr_row=0, scr_column=2)
-    results_text = gui.create_text(txt_parent=results_frame, txt_yscrollcommand=results_scrollbar.set, txt_row=0, txt_column=0, txt_columnspan=3, txt_sticky='n',
-                                   txt_text=protein_parser.parse_results.loc[:,['Residue 1', 'Residue 1 id', 'Residue 2', 'Residue 2 id', 'Distance']].head(50))
+    results_text = gui.create_text(txt_parent=results_frame, txt_yscrollcommand=results_scrollbar.set, txt_row=0, txt_column=0, txt_columnspan=3, txt_sticky='n')
     results_text.config(highlightthickness=0, borderwidth=0)
     results_scrollbar.config(command=results_text.yview,)
-    gui.create_button(btn_text="Go back", btn_command=lambda: [gui.clear_page(), goto_mainpage()], 
+    gui.create_button(btn_parent=page, btn_text="Go back", btn_command=goto_mainpage, 
                       btn_column=0, btn_row=1, btn_sticky='sw', add_padx=(20, 10))
-    gui.create_button(btn_text="Export results", btn_command=lambda: [prompt_save_excel()], btn_column=2, btn_row=1, btn_sticky='se', add_padx=(10, 20))
-    criteria_frame = gui.create_frame(frm_parent=gui.window, frm_bg=WHITEGRAY, frm_width=60, frm_height=100, frm_row=1, frm_column=1, frm_sticky="nsew", add_padx=(5),
+    gui.create_button(btn_parent=page, btn_text="Export results", btn_command=prompt_save_excel, btn_column=2, btn_row=1, btn_sticky='se', add_padx=(10, 20))
+    criteria_frame = gui.create_frame(frm_parent=page, frm_bg=WHITEGRAY, frm_width=60, frm_height=100, frm_row=1, frm_column=1, frm_sticky="nsew", add_padx=(5),
                                       add_pady=(40, 0), frm_rowconfigure=1, frm_columnconfigure=1)
     criteria_scroll = gui.create_scrollbar(scr_parent=criteria_frame, scr_row=1, scr_column=2)
-    criteria_text = gui.create_text(txt_parent=criteria_frame, txt_row=1, txt_column=1, txt_sticky='w', txt_text=protein_parser.rule_summary)
+    criteria_text = gui.create_text(txt_parent=criteria_frame, txt_row=1, txt_column=1, txt_sticky='w')
     criteria_scroll.config(command=criteria_text.yview)
-    gui.reweight_rows_cols(row_weights=[2, 1], col_weights=[1, 1])
+    gui.reweight_frame_rows_cols(rew_frame=page, row_weights=[2, 1], col_weights=[1, 1])
+    page_widgets['results_text'] = results_text
+    page_widgets['criteria_text'] = criteria_text
+
+def goto_results_page():
+    gui.show_page('results', build_results_page)
+    gui.set_text(page_widgets['results_text'], state.protein_parser.results_preview())
+    gui.set_text(page_widgets['criteria_text'], state.protein_parser.rule_summary)
 
 # ---------------------------- General functions ------------------------------- #
 
 def on_back_from_criteria() -> None:
     """Handle back button from criteria page."""
-    parse_criteria.cache_rules()
-    parse_criteria.reset_entry_widgets()
-    gui.clear_page()
+    state.parse_criteria.cache_rules()
+    state.parse_criteria.reset_entry_widgets()
     goto_mainpage()
 
+def on_add_rule() -> None:
+    """Handle add rule button."""
+    add_rule(page_widgets['rules_frame'], page_widgets['add_rule_btn'])
+
 def on_import_rules() -> None:
     """Handle import rules button."""
-    if parse_criteria.import_rules():
-        parse_criteria.reset_entry_widgets()
+    from tkinter import messagebox
+
+    if state.parse_criteria.import_rules():
+        state.parse_criteria.reset_entry_widgets()
         goto_criteria()
     else:
         messagebox.showerror("Import Error", "Failed to import rules file")
 
 def on_save_rules() -> None:
     """Handle save rules button."""
-    if parse_criteria.save_rules():
-        messagebox.showinfo("Success", f"Rules saved to {parse_criteria.rules_file}")
+    from tkinter import messagebox
+
+    if state.parse_criteria.save_rules():
+        messagebox.showinfo("Success", f"Rules saved to {state.parse_criteria.rules_file}")
     else:
         messagebox.showerror("Save Error", "Failed to save rules")
 
+def set_parse_controls_state(control_state: str) -> None:
+    """Enable or disable the main page controls that change the parser's input.
+    
+    They stay disabled while a background parse is using the parser.
+    
+    Args:
+        control_state: 'normal' or 'disable'
+    """
+    for widget_key in ('select_file_btn', 'criteria_btn', 'run_btn'):
+        page_widgets[widget_key].config(state=control_state)
+    cbo_state = 'readonly' if control_state == 'normal' else 'disabled'
+    for widget_key in ('model_cbo_box', 'chain_cbo_box'):
+        if widget_key in page_widgets:
+            page_widgets[widget_key].config(state=cbo_state)
+
 def run_and_goto_results() -> None:
-    """Run the parser and navigate to results page."""
-    if run_interaction_criteria(cached_rules=parse_criteria.cached_rules):
-        goto_results_page()
+    """Start the parser in the background and poll until it finishes."""
+    set_parse_controls_state('disable')
+    state.parse_future = parse_executor.submit(
+        run_interaction_criteria, 
+        cached_rules=state.parse_criteria.cached_rules, 
+        rule_columns=state.parse_criteria.cached_rules_columns
+    )
+    gui.window.after(PARSE_POLL_MS, poll_parser, 0)
+
+def poll_parser(tick: int) -> None:
+    """Animate the status label while parsing, then show the results.
+    
+    Args:
+        tick: Number of polls so far, used to pick the spinner frame
+    """
+    from tkinter import messagebox
+
+    if not state.parse_future.done():
+        spinner = SPINNER_FRAMES[tick % len(SPINNER_FRAMES)]
+        page_widgets['filename_lbl'].config(text=f'Parsing {state.protein_parser.protein_name} {spinner}')
+        gui.window.after(PARSE_POLL_MS, poll_parser, tick + 1)
+        return
+        
+    page_widgets['filename_lbl'].config(text=f'Opened: {state.protein_parser.protein_name}')
+    set_parse_controls_state('normal')
+    try:
+        parse_succeeded = state.parse_future.result()
+    except Exception as e:
+        logger.error("Error during parsing: %s", e)
+        parse_succeeded = False
+        
+    if parse_succeeded:
+        # Only move on from the main page, so leaving another page never skips its own handler
+        if gui.current_page == 'main':
+            goto_results_page()
     else:
         messagebox.showerror("Parse Error", "Failed to parse protein structure")
 
 def browse_files() -> None:
     """Open file dialog to select a PDB file."""
+    from tkinter import filedialog, messagebox
+
     filename_fullpath = filedialog.askopenfilename(
         initialdir="/", 
         title="Select a File", 
-        filetypes=(("PDB File", "*.pdb*"), ("all files", "*.*"))
+        filetypes=(("PDB File", "*.pdb*"), ("mmCIF File", "*.cif *.mmcif"), ("all files", "*.*"))
     )
     
     if filename_fullpath and isinstance(filename_fullpath, str) and filename_fullpath != '':
         try:
             file_path = Path(filename_fullpath)
             filename = file_path.stem
-            protein_parser.update_protein_name(filename)
-            protein_parser.update_protein_file(file_path)
-            if protein_parser.update_protein_structure():
-                protein_parser.detect_models_chains()
+            state.protein_parser.update_protein_name(filename)
+            state.protein_parser.update_protein_file(file_path)
+            if state.protein_parser.update_protein_structure():
+                state.protein_parser.detect_models_chains()
             else:
                 messagebox.showerror("File Error", "Failed to load PDB file")
         except Exception as e:
-            logger.error(f"Error loading file: {e}")
+            logger.error("Error loading file: %s", e)
             messagebox.showerror("File Error", f"Error loading file: {e}")
     
-    gui.clear_page()
     goto_mainpage()
 
-def run_interaction_criteria(cached_rules: Optional[List[Dict[str, Any]]]) -> bool:
+def run_interaction_criteria(
+    cached_rules: Optional[List[Dict[str, Any]]], 
+    rule_columns: Optional[Dict[str, Any]] = None
+) -> bool:
     """Run the parser with cached rules.
     
     Args:
         cached_rules: List of rule dictionaries
+        rule_columns: Columnar layout of the same rules
         
     Returns:
         True if parsing was successful
     """
-    return protein_parser.run_parser(rule_cache=cached_rules)
+    return state.protein_parser.run_parser(rule_cache=cached_rules, rule_columns=rule_columns)
+
+def create_rule_row(gui_frame: Frame, row: int, cached_rule: Optional[Dict[str, Any]] = None) -> List[Entry]:
+    """Create the four entry widgets of one rule row, prefilled from a cached rule.
+    
+    Args:
+        gui_frame: The parent frame to add widgets to
+        row: Grid row of the rule within the frame
+        cached_rule: Rule dictionary whose values prefill the entries
+        
+    Returns:
+        List of Entry widgets [name, group1, group2, distance]
+    """
+    if cached_rule:
+        row_texts = (
+            cached_rule["name"], 
+            ','.join(cached_rule["grp1"]), 
+            ','.join(cached_rule["grp2"]), 
+            cached_rule["distance"]
+        )
+    else:
+        row_texts = ('', '', '', '')
+        
+    return [
+        gui.create_entry(ety_parent=gui_frame, ety_text=row_text, ety_sticky='w', ety_row=row, add_pady=(20, 0), **column_kw)
+        for row_text, column_kw in zip(row_texts, RULE_ENTRY_COLUMN_KW)
+    ]
 
 def add_rule(gui_frame: Frame, btn: Button) -> None:
     """Add a new rule entry row to the criteria frame.
@@ -292,43 +497,9 @@ def add_rule(gui_frame: Frame, btn: Button) -> None:
         gui_frame: The parent frame to add widgets to
         btn: The add rule button (to disable when limit reached)
     """
-    rule_name = gui.create_entry(
-        ety_parent=gui_frame, 
-        ety_sticky='w', 
-        ety_row=parse_criteria.num_rules_index, 
-        add_pady=(20, 0), 
-        add_padx=(10, 0), 
-        ety_column=0, 
-        ety_width=15
-    )
-    rule_group1 = gui.create_entry(
-        ety_parent=gui_frame, 
-        ety_sticky='w', 
-        ety_row=parse_criteria.num_rules_index, 
-        add_pady=(20, 0), 
-        add_padx=(60, 20), 
-        ety_column=1, 
-        ety_width=30
-    )
-    rule_group2 = gui.create_entry(
-        ety_parent=gui_frame, 
-        ety_sticky='w', 
-        ety_row=parse_criteria.num_rules_index, 
-        add_pady=(20, 0), 
-        add_padx=(10, 20), 
-        ety_column=2, 
-        ety_width=30
-    )
-    rule_distance = gui.create_entry(
-        ety_parent=gui_frame, 
-        ety_sticky='w', 
-        ety_row=parse_criteria.num_rules_index, 
-        add_pady=(20, 0), 
-        add_padx=(20, 10), 
-        ety_column=3, 
-        ety_width=5
-    )
-    parse_criteria.store_new_rule(new_rule_list=[rule_name, rule_group1, rule_group2, rule_distance])
+    parse_criteria = state.parse_criteria
+    new_rule_list = create_rule_row(gui_frame=gui_frame, row=parse_criteria.num_rules_index)
+    parse_criteria.store_new_rule(new_rule_list=new_rule_list)
     parse_criteria.num_rules_index += 1
     
     if parse_criteria.num_rules_index >= MAX_RULES:
@@ -338,57 +509,26 @@ def add_rule(gui_frame: Frame, btn: Button) -> None:
 def initialize_rules(gui_frame: Frame) -> None:
     """Initialize rule entry widgets from cached rules.
     
+    Entries are created with their text already set, so each row costs one
+    widget construction and one grid call per column.
+    
     Args:
         gui_frame: The parent frame to add widgets to
     """
-    for i in range(parse_criteria.num_rules_index):
-        rule_name = gui.create_entry(
-            ety_parent=gui_frame, 
-            ety_sticky='w', 
-            ety_row=i, 
-            add_pady=(20, 0), 
-            add_padx=(10, 0), 
-            ety_column=0, 
-            ety_width=15
-        )
-        rule_group1 = gui.create_entry(
-            ety_parent=gui_frame, 
-            ety_sticky='w', 
-            ety_row=i, 
-            add_pady=(20, 0), 
-            add_padx=(60, 20), 
-            ety_column=1, 
-            ety_width=30
-        )
-        rule_group2 = gui.create_entry(
-            ety_parent=gui_frame, 
-            ety_sticky='w', 
-            ety_row=i, 
-            add_pady=(20, 0), 
-            add_padx=(10, 20), 
-            ety_column=2, 
-            ety_width=30
-        )
-        rule_distance = gui.create_entry(
-            ety_parent=gui_frame, 
-            ety_sticky='w', 
-            ety_row=i, 
-            add_pady=(20, 0), 
-            add_padx=(20, 10), 
-            ety_column=3, 
-            ety_width=5
-        )
-        parse_criteria.store_new_rule(new_rule_list=[rule_name, rule_group1, rule_group2, rule_distance])
-        
+    # Bind the hot lookups once rather than resolving them on every row
+    store_new_rule = state.parse_criteria.store_new_rule
+    cached_rules = state.parse_criteria.cached_rules or []
+    num_cached_rules = len(cached_rules)
+    
+    for i in range(state.parse_criteria.num_rules_index):
         # Populate from cached rules if available
-        if parse_criteria.cached_rules and i < len(parse_criteria.cached_rules):
-            rule_name.insert(0, parse_criteria.cached_rules[i]["name"])
-            rule_group1.insert(0, ','.join(parse_criteria.cached_rules[i]["grp1"]))
-            rule_group2.insert(0, ','.join(parse_criteria.cached_rules[i]["grp2"]))
-            rule_distance.insert(0, parse_criteria.cached_rules[i]["distance"])
+        cached_rule = cached_rules[i] if i < num_cached_rules else None
+        store_new_rule(new_rule_list=create_rule_row(gui_frame=gui_frame, row=i, cached_rule=cached_rule))
 
 def prompt_save_excel() -> None:
     """Prompt user to save results to Excel file."""
+    from tkinter import filedialog, messagebox
+
     excel_filename = filedialog.asksaveasfilename(
         initialdir="/", 
         title="Save results", 
@@ -397,8 +537,12 @@ def prompt_save_excel() -> None:
     )
     
     if excel_filename:
-        if protein_parser.save_to_excel(excel_name=excel_filename):
-            messagebox.showinfo("Success", f"Results saved to {Path(excel_filename).name}")
+        if state.protein_parser.save_to_excel(excel_name=excel_filename):
+            saved_message = f"Results saved to {Path(excel_filename).name}"
+            full_results_file = state.protein_parser.full_results_file
+            if full_results_file is not None:
+                saved_message += f"\nFull results table saved to {full_results_file.name}"
+            messagebox.showinfo("Success", saved_message)
         else:
             messagebox.showerror("Save Error", "Failed to save results")
 
@@ -406,13 +550,13 @@ def prompt_save_excel() -> None:
 
 def main() -> None:
     """Initialize and start the PRIP application."""
-    global gui, protein_parser, parse_criteria
+    global gui, state
     
     gui = GuiMaster()
-    protein_parser = ProteinParser()
-    parse_criteria = ParserCriteria()
+    state = AppState()
     
     goto_mainpage()
+    gui.window.after_idle(state.warm_up)
     gui.window.mainloop()
 
 
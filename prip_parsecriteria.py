@@ -1,18 +1,106 @@
 """Module for managing and validating parsing criteria/rules for protein interactions."""
 
+from functools import lru_cache
 import json
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from tkinter import Entry
 
-from config import ACCEPTED_AMINO_ACIDS, STARTING_RULES, MAX_RULES, DEFAULT_RULES_FILE
+import numpy as np
+
+from config import (
+    ACCEPTED_AMINO_ACIDS, AA_GROUP_RE, ABBREV_CODE_INDEX, CODE_INDEX, 
+    STARTING_RULES, MAX_RULES, DEFAULT_RULES_FILE
+)
+
+# orjson is optional; its decode error subclasses json.JSONDecodeError
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Buffer size for reading and writing rule files
+RULES_FILE_BUFFER = 65536
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _parse_group(group_str: str, accepted: frozenset[str]) -> Tuple[bool, Tuple[str, ...], str]:
+    """Split a comma-separated amino acid group and validate its codes.
+    
+    Results are memoized, since the same group strings are parsed on every
+    rule submission and every cache of the rules.
+    
+    Args:
+        group_str: Comma-separated amino acid codes
+        accepted: Accepted amino acid codes
+        
+    Returns:
+        Tuple of (is_valid, upper-cased codes, first invalid code or '')
+    """
+    codes = tuple(code.strip().upper() for code in group_str.split(","))
+    # AA_GROUP_RE is built from ACCEPTED_AMINO_ACIDS, so it is only a shortcut for that set;
+    # otherwise, or when it fails, scan the codes against `accepted` to report the bad one
+    if accepted is not ACCEPTED_AMINO_ACIDS or not AA_GROUP_RE.fullmatch(group_str):
+        for code in codes:
+            if code and code not in accepted:
+                return False, codes, code
+    return True, codes, ''
+
+
+def build_rule_columns(rules: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Lay out cached rules column by column, for evaluating all rules at once.
+    
+    Each rule's groups become a boolean row over CODE_INDEX, with one extra
+    always-False column that non-standard residues (code -1) index into.
+    
+    Args:
+        rules: Cached rule dictionaries
+        
+    Returns:
+        Dictionary of 'name' (list), 'grp1_mask' and 'grp2_mask' ((rules, codes)
+        bool arrays), 'distance' (float32 array, NaN if not parsable) and
+        'parsable' (bool array)
+    """
+    num_rules = len(rules)
+    grp1_mask = np.zeros((num_rules, len(CODE_INDEX) + 1), dtype=bool)
+    grp2_mask = np.zeros_like(grp1_mask)
+    distance = np.full(num_rules, np.nan)
+    parsable = np.zeros(num_rules, dtype=bool)
+    
+    for row, rule in enumerate(rules):
+        if rule.get('parsable') != 'yes':
+            continue
+        try:
+            distance[row] = float(rule['distance'])
+        except (KeyError, TypeError, ValueError):
+            logger.warning("Skipping rule with invalid distance: %s", rule.get('name', ''))
+            continue
+        parsable[row] = True
+        # 'R' and 'ARG' share a CODE_INDEX value, so they are equivalent in a group
+        for group, mask in (('grp1', grp1_mask), ('grp2', grp2_mask)):
+            mask[row, [index for code in rule.get(group, ()) if (index := ABBREV_CODE_INDEX.get(code)) is not None]] = True
+        
+    # Distances are float32, so thresholds are too; rounding them up to the next
+    # float32 keeps "distance < threshold" identical to the float64 comparison
+    distance_f32 = distance.astype(np.float32)
+    rounded_down = distance_f32 < distance
+    distance_f32[rounded_down] = np.nextafter(distance_f32[rounded_down], np.float32(np.inf))
+        
+    return {
+        'name': [rule.get('name', '') for rule in rules],
+        'grp1_mask': grp1_mask,
+        'grp2_mask': grp2_mask,
+        'distance': distance_f32,
+        'parsable': parsable
+    }
+
+
 class ParserCriteria:
     """Manages parsing rules for protein residue interactions."""
     
@@ -27,7 +115,8 @@ class ParserCriteria:
         self.saved_rules: Dict[str, Any] = {"numRules": 0, "ruleList": []}
         self.rule_entry_widgets: List[Dict[str, Entry]] = []
         self.cached_rules: Optional[List[Dict[str, Any]]] = None
-        self.accepted_abbrev: tuple = ACCEPTED_AMINO_ACIDS
+        self.cached_rules_columns: Optional[Dict[str, Any]] = None
+        self.accepted_abbrev: frozenset[str] = ACCEPTED_AMINO_ACIDS
         self.rules_file: Path = Path(rules_file)
 
     def store_new_rule(self, new_rule_list: List[Entry]) -> None:
@@ -37,7 +126,7 @@ class ParserCriteria:
             new_rule_list: List of Entry widgets [name, group1, group2, distance]
         """
         if len(new_rule_list) != 4:
-            logger.warning(f"Expected 4 widgets, got {len(new_rule_list)}")
+            logger.warning("Expected 4 widgets, got %s", len(new_rule_list))
             return
             
         entry_widget = {
@@ -61,12 +150,16 @@ class ParserCriteria:
             return False
             
         try:
-            with open(self.rules_file, 'w') as saving_file:
-                json.dump(self.cached_rules, saving_file, indent=4)
-            logger.info(f"Rules saved to {self.rules_file}")
+            if orjson is not None:
+                rules_bytes = orjson.dumps(self.cached_rules, option=orjson.OPT_INDENT_2)
+            else:
+                rules_bytes = json.dumps(self.cached_rules, indent=4).encode('utf-8')
+            with open(self.rules_file, 'wb', buffering=RULES_FILE_BUFFER) as saving_file:
+                saving_file.write(rules_bytes)
+            logger.info("Rules saved to %s", self.rules_file)
             return True
         except (IOError, PermissionError) as e:
-            logger.error(f"Error saving rules: {e}")
+            logger.error("Error saving rules: %s", e)
             return False
 
     def import_rules(self) -> bool:
@@ -77,23 +170,25 @@ class ParserCriteria:
         """
         try:
             if not self.rules_file.exists():
-                logger.warning(f"Rules file not found: {self.rules_file}")
+                logger.warning("Rules file not found: %s", self.rules_file)
                 return False
                 
-            with open(self.rules_file, 'r') as import_file:
-                self.cached_rules = json.load(import_file)
+            with open(self.rules_file, 'rb', buffering=RULES_FILE_BUFFER) as import_file:
+                rules_bytes = import_file.read()
+            self.cached_rules = orjson.loads(rules_bytes) if orjson is not None else json.loads(rules_bytes)
                 
             if isinstance(self.cached_rules, list):
                 self.num_rules_index = len(self.cached_rules)
+                self.cached_rules_columns = build_rule_columns(self.cached_rules)
             else:
                 logger.warning("Unexpected rules format")
                 return False
                 
-            logger.info(f"Rules imported from {self.rules_file}")
+            logger.info("Rules imported from %s", self.rules_file)
             return True
             
-        except (IOError, json.JSONDecodeError) as e:
-            logger.error(f"Error importing rules: {e}")
+        except (IOError, UnicodeDecodeError, json.JSONDecodeError) as e:
+            logger.error("Error importing rules: %s", e)
             return False
 
     def cache_rules(self) -> None:
@@ -110,7 +205,7 @@ class ParserCriteria:
                 if not rule_to_cache["name"]:
                     rule_to_cache["name"] = f"Rule {len(self.cached_rules) + 1}"
             except Exception as e:
-                logger.warning(f"Error getting rule name: {e}")
+                logger.warning("Error getting rule name: %s", e)
                 rule_to_cache["name"] = f"Rule {len(self.cached_rules) + 1}"
                 parsable = 'no'
             
@@ -119,10 +214,10 @@ class ParserCriteria:
                 distance_str = rule["distance"].get().strip()
                 rule_to_cache["distance"] = float(distance_str)
                 if rule_to_cache["distance"] <= 0:
-                    logger.warning(f"Distance must be positive: {rule_to_cache['distance']}")
+                    logger.warning("Distance must be positive: %s", rule_to_cache['distance'])
                     parsable = 'no'
             except (ValueError, AttributeError) as e:
-                logger.warning(f"Invalid distance value: {e}")
+                logger.warning("Invalid distance value: %s", e)
                 rule_to_cache["distance"] = rule["distance"].get()
                 parsable = 'no'
             
@@ -135,26 +230,22 @@ class ParserCriteria:
                         parsable = 'no'
                         continue
                         
-                    split_rule = current_group.split(sep=",")
-                    stripped_rule = [protein.strip().upper() for protein in split_rule]
-                    rule_to_cache[group] = stripped_rule
-                    
-                    # Validate all abbreviations
-                    for abbrev in stripped_rule:
-                        if abbrev and abbrev not in self.accepted_abbrev:
-                            logger.warning(f"Invalid amino acid abbreviation: {abbrev}")
-                            parsable = 'no'
-                            break
+                    is_valid, codes, invalid_code = _parse_group(current_group, self.accepted_abbrev)
+                    rule_to_cache[group] = list(codes)
+                    if not is_valid:
+                        logger.warning("Invalid amino acid abbreviation: %s", invalid_code)
+                        parsable = 'no'
                             
                 except (AttributeError, Exception) as e:
-                    logger.warning(f"Error processing group {group}: {e}")
+                    logger.warning("Error processing group %s: %s", group, e)
                     rule_to_cache[group] = rule[group].get() if hasattr(rule[group], 'get') else []
                     parsable = 'no'
             
             rule_to_cache['parsable'] = parsable
             self.cached_rules.append(rule_to_cache)
         
-        logger.info(f"Cached {len(self.cached_rules)} rules")
+        self.cached_rules_columns = build_rule_columns(self.cached_rules)
+        logger.info("Cached %s rules", len(self.cached_rules))
 
     def reset_entry_widgets(self) -> None:
         """Clear all stored entry widget references."""
@@ -190,9 +281,8 @@ class ParserCriteria:
             if not group_value or not group_value.strip():
                 return False, f"{group_name} cannot be empty"
             
-            amino_acids = [aa.strip().upper() for aa in group_value.split(",")]
-            for aa in amino_acids:
-                if aa and aa not in self.accepted_abbrev:
-                    return False, f"Invalid amino acid code in {group_name}: {aa}"
+            is_valid, _, invalid_code = _parse_group(group_value, self.accepted_abbrev)
+            if not is_valid:
+                return False, f"Invalid amino acid code in {group_name}: {invalid_code}"
         
         return True, ""
@@ -1,18 +1,155 @@
 """Parser module for analyzing protein structures and residue interactions."""
 
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Set, Tuple, Union
 import logging
 
-from Bio.PDB import PDBParser, Structure, Model, Chain
+from Bio.PDB import PDBParser, MMCIFParser, Structure, Model, Chain
 from Bio.PDB.PDBExceptions import PDBConstructionException
+from Bio.PDB.kdtrees import KDTree
 import pandas as pd
 import numpy as np
+from xlsxwriter.exceptions import XlsxWriterException
+from xlsxwriter.format import Format
+from xlsxwriter.workbook import Workbook
+
+from config import ABBREV_CODE_INDEX
+from prip_parsecriteria import build_rule_columns
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# File suffixes read with the mmCIF parser instead of the PDB parser
+MMCIF_SUFFIXES = ('.cif', '.mmcif')
+# Number of parsed structures kept so reopening a file skips re-tokenizing it
+STRUCTURE_CACHE_SIZE = 4
+# Rows converted at a time when writing an Excel sheet
+EXCEL_WRITE_BLOCK_ROWS = 10000
+# Pair count from which the full table is saved to Parquet instead of an Excel sheet
+COMPREHENSIVE_SHEET_MAX_ROWS = 100000
+# Excel's limit on the length of a sheet name
+MAX_SHEET_NAME_LENGTH = 31
+# Excel's limit on the number of rows in a sheet, header row included
+EXCEL_MAX_ROWS = 1048576
+# Residue pairs checked against the rules at a time
+PAIR_BLOCK_SIZE = 65536
+
+
+def _pairs_within(coords: np.ndarray, cutoff: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find all residue pairs whose CA atoms are closer than a cutoff.
+    
+    Args:
+        coords: (N, 3) array of CA coordinates
+        cutoff: Exclusive distance limit
+        
+    Returns:
+        Tuple of (first residue indices, second residue indices, distances),
+        with the first index lower and pairs sorted in chain order
+    """
+    # The tree measures in float64, but pairs are kept by their float32 distance below, which
+    # can round under the cutoff; pad the radius by a few float32 ULPs so none is missed
+    neighbors = KDTree(coords.astype(np.float64), 10).neighbor_search(cutoff * (1 + 1e-6))
+    index1 = np.fromiter((neighbor.index1 for neighbor in neighbors), dtype=np.intp, count=len(neighbors))
+    index2 = np.fromiter((neighbor.index2 for neighbor in neighbors), dtype=np.intp, count=len(neighbors))
+    pair_i = np.minimum(index1, index2)
+    pair_j = np.maximum(index1, index2)
+    
+    # The padded search can include pairs at or just past the cutoff; rules use a strict limit.
+    # The float32 distances computed for this test are the ones reported.
+    distances = np.linalg.norm(coords[pair_i] - coords[pair_j], axis=1)
+    within = distances < cutoff
+    pair_i, pair_j, distances = pair_i[within], pair_j[within], distances[within]
+    order = np.lexsort((pair_j, pair_i))
+    return pair_i[order], pair_j[order], distances[order]
+
+
+def _unique_sheet_name(name: str, used_names: Set[str]) -> str:
+    """Return an Excel sheet name not yet in used_names, and record it there.
+    
+    Names are cut to Excel's 31-character limit; a name already taken (compared
+    case-insensitively, as Excel does) gets a " (2)", " (3)", ... suffix.
+    
+    Args:
+        name: Preferred sheet name
+        used_names: Lower-cased names of the sheets written so far
+        
+    Returns:
+        The sheet name to use
+    """
+    base_name = name[:MAX_SHEET_NAME_LENGTH] or 'Sheet'
+    sheet_name = base_name
+    copy_number = 2
+    while sheet_name.lower() in used_names:
+        suffix = f' ({copy_number})'
+        sheet_name = base_name[:MAX_SHEET_NAME_LENGTH - len(suffix)] + suffix
+        copy_number += 1
+    used_names.add(sheet_name.lower())
+    return sheet_name
+
+
+def _pair_cutoff(num_residues: int, rule_dists: np.ndarray, all_pairs: bool) -> float:
+    """Return the distance limit of the pairs a parse needs (infinite for every pair)."""
+    if len(rule_dists) and not all_pairs and num_residues > 1:
+        return float(rule_dists.max())
+    return float('inf')
+
+
+def _compute_pairs(
+    coords: np.ndarray, 
+    codes: np.ndarray, 
+    grp1_mask: np.ndarray, 
+    grp2_mask: np.ndarray, 
+    rule_dists: np.ndarray, 
+    all_pairs: bool = False, 
+    pairs: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Find the residue pairs of a chain and the pairs matching each rule.
+    
+    Only plain arrays go in and out, so the same kernel serves any model or
+    chain without touching the parser state.
+    
+    Args:
+        coords: (N, 3) array of CA coordinates
+        codes: CODE_INDEX value of each residue (-1 if non-standard)
+        grp1_mask: (rules, codes) group 1 membership, as built by build_rule_columns
+        grp2_mask: (rules, codes) group 2 membership, as built by build_rule_columns
+        rule_dists: Exclusive distance limit of each rule
+        all_pairs: Return every pair instead of only those within the largest rule distance
+        pairs: Previously found (first indices, second indices, distances) to use
+            instead of searching again
+        
+    Returns:
+        Tuple of (first residue indices, second residue indices, distances,
+        (rules, pairs) boolean match masks)
+    """
+    if pairs is not None:
+        pair_i, pair_j, distances = pairs
+    else:
+        cutoff = _pair_cutoff(len(coords), rule_dists, all_pairs)
+        if np.isfinite(cutoff):
+            pair_i, pair_j, distances = _pairs_within(coords, cutoff)
+        else:
+            pair_i, pair_j = np.triu_indices(len(coords), k=1)
+            distances = np.linalg.norm(coords[pair_i] - coords[pair_j], axis=1)
+    
+    # All rules are evaluated at once: group membership of each pair's residues
+    # is looked up per rule row, then broadcast against each rule's distance.
+    # Pairs are taken in blocks so the (rules, block) temporaries stay in cache.
+    rule_masks = np.empty((len(rule_dists), len(pair_i)), dtype=bool)
+    rule_dist_column = rule_dists[:, None]
+    for block_start in range(0, len(pair_i), PAIR_BLOCK_SIZE):
+        block = slice(block_start, block_start + PAIR_BLOCK_SIZE)
+        codes_i = codes[pair_i[block]]
+        codes_j = codes[pair_j[block]]
+        rule_masks[:, block] = (
+            ((grp1_mask[:, codes_i] & grp2_mask[:, codes_j]) | (grp2_mask[:, codes_i] & grp1_mask[:, codes_j])) &
+            (distances[block] < rule_dist_column)
+        )
+    return pair_i, pair_j, distances, rule_masks
+
 
 class ProteinParser:
     """Parses PDB files and analyzes residue-residue interactions."""
@@ -22,16 +159,28 @@ class ProteinParser:
         self.protein_name: Optional[str] = None
         self.protein_file: Optional[Path] = None
         self.parser: PDBParser = PDBParser(QUIET=True)
+        self.cif_parser: MMCIFParser = MMCIFParser(QUIET=True)
+        self._structure_cache: OrderedDict[Tuple[str, int, int], Structure.Structure] = OrderedDict()
+        # Residue arrays and the last pair search for the current (structure, model, chain), reused
+        # on reruns; only one chain is kept, since a large chain's pair arrays can take hundreds of MB
+        self._pair_cache: Dict[Tuple[int, Any, Any], Dict[str, Any]] = {}
         self.protein_structure: Optional[Structure.Structure] = None
 
         self.model_list: List[int] = []
+        # Model serial number (as listed in model_list) to the model id used to index the structure
+        self._model_ids: Dict[int, int] = {}
         self.chain_list: List[str] = []
         self.selected_model: Union[int, float] = 0
         self.selected_chain: Union[str, int, float] = 0
-        self.parse_results: Optional[pd.DataFrame] = None
+        self._result_columns: Optional[List[Union[np.ndarray, pd.api.extensions.ExtensionArray]]] = None
+        self._result_column_names: List[str] = []
+        self._parse_results: Optional[pd.DataFrame] = None
+        self._results_preview: Optional[str] = None
         self.protein_file_selected: bool = False
         self.rule_results: List[Dict[str, Any]] = []
         self.rule_summary: str = ''
+        # Parquet file holding the full table when the last Excel export left it out
+        self.full_results_file: Optional[Path] = None
 
     def detect_models_chains(self) -> None:
         """Detect available models and chains in the loaded protein structure."""
@@ -40,12 +189,16 @@ class ProteinParser:
             return
             
         try:
-            self.model_list = [model.serial_num for model in self.protein_structure]
+            # PDBParser and MMCIFParser number model ids from 0 but serial numbers from 1
+            # (0 for PDB files without MODEL records), so serials are mapped back to ids
+            self._model_ids = {model.serial_num: model.id for model in self.protein_structure}
+            self.model_list = list(self._model_ids)
             self.chain_list = [chain.get_id() for chain in self.protein_structure[0]]
             self.selected_model = self.model_list[0] if self.model_list else 0
             self.selected_chain = self.chain_list[0] if self.chain_list else 0
         except (IndexError, KeyError) as e:
-            logger.error(f"Error detecting models/chains: {e}")
+            logger.error("Error detecting models/chains: %s", e)
+            self._model_ids = {}
             self.model_list = []
             self.chain_list = []
 
@@ -96,19 +249,51 @@ class ProteinParser:
             return False
             
         try:
-            self.protein_structure = self.parser.get_structure(self.protein_name, str(self.protein_file))
-            logger.info(f"Successfully loaded structure: {self.protein_name}")
+            file_stat = self.protein_file.stat()
+            cache_key = (str(self.protein_file.resolve()), file_stat.st_mtime_ns, file_stat.st_size)
+            if cache_key in self._structure_cache:
+                self._structure_cache.move_to_end(cache_key)
+                self.protein_structure = self._structure_cache[cache_key]
+                self._pair_cache.clear()
+                logger.info("Reusing parsed structure: %s", self.protein_name)
+                return True
+                
+            if self.protein_file.suffix.lower() in MMCIF_SUFFIXES:
+                structure_parser = self.cif_parser
+            else:
+                structure_parser = self.parser
+            self.protein_structure = structure_parser.get_structure(self.protein_name, str(self.protein_file))
+            self._pair_cache.clear()
+            
+            self._structure_cache[cache_key] = self.protein_structure
+            if len(self._structure_cache) > STRUCTURE_CACHE_SIZE:
+                self._structure_cache.popitem(last=False)
+            logger.info("Successfully loaded structure: %s", self.protein_name)
             return True
-        except (FileNotFoundError, PDBConstructionException) as e:
-            logger.error(f"Error loading PDB file: {e}")
+        except (FileNotFoundError, ValueError, PDBConstructionException) as e:
+            logger.error("Error loading PDB file: %s", e)
             self.protein_structure = None
             return False
 
-    def run_parser(self, rule_cache: Optional[List[Dict[str, Any]]]) -> bool:
+    def run_parser(
+        self, 
+        rule_cache: Optional[List[Dict[str, Any]]], 
+        report_all_pairs: bool = False, 
+        rule_columns: Optional[Dict[str, Any]] = None
+    ) -> bool:
         """Parse protein residues and identify interactions based on rules.
         
+        When parsable rules are given, only pairs closer than the largest rule
+        distance can match, so those pairs are found with a KD-tree radius
+        search and the other pairs are left out of the results. Residue data
+        and the last pair search are cached per chain, so rerunning with edited
+        rules mostly re-evaluates the rule masks.
+        
         Args:
             rule_cache: List of rule dictionaries containing interaction criteria
+            report_all_pairs: Report every residue pair even when rules are given
+            rule_columns: Columnar layout of rule_cache from build_rule_columns;
+                built here when not given
             
         Returns:
             True if parsing was successful, False otherwise
@@ -117,98 +302,152 @@ class ProteinParser:
             logger.error("No protein structure loaded")
             return False
             
+        self._result_columns = None
+        self._parse_results = None
+        self._results_preview = None
         try:
-            final_result_list: List[List[Any]] = []
             self.rule_results = []
-            chain: Chain.Chain = self.protein_structure[self.selected_model][self.selected_chain]
             parsable_rules: List[Dict[str, Any]] = []
             df_columns = ['Residue 1', 'Residue 1 id', 'Residue 2', 'Residue 2 id', 'Distance']
             
-            # Prepare parsable rules
-            if rule_cache:
-                for cache in rule_cache:
-                    if cache.get('parsable') == 'yes':
-                        cache_copy = cache.copy()
-                        cache_copy['results'] = []
-                        cache_copy['counter'] = 0
-                        parsable_rules.append(cache_copy)
-                        df_columns.append(cache['name'])
+            # Prepare parsable rules; their groups and distances come from the columnar rule layout
+            if rule_columns is None:
+                rule_columns = build_rule_columns(rule_cache or [])
+            parsable = rule_columns['parsable']
+            grp1_mask = rule_columns['grp1_mask'][parsable]
+            grp2_mask = rule_columns['grp2_mask'][parsable]
+            rule_dists = rule_columns['distance'][parsable]
+            for cache, is_parsable in zip(rule_cache or [], parsable):
+                if is_parsable:
+                    cache_copy = cache.copy()
+                    cache_copy['counter'] = 0
+                    parsable_rules.append(cache_copy)
+                    df_columns.append(cache['name'])
+            
+            # Read each residue's CA coordinates, name and id once, in a single pass;
+            # residues without a CA atom (e.g. waters) are skipped
+            chain_key = (id(self.protein_structure), self.selected_model, self.selected_chain)
+            chain_data = self._pair_cache.get(chain_key)
+            if chain_data is None:
+                model_id = self._model_ids.get(self.selected_model, self.selected_model)
+                chain: Chain.Chain = self.protein_structure[model_id][self.selected_chain]
+                ca_coords: List[np.ndarray] = []
+                names: List[str] = []
+                ids: List[str] = []
+                for residue in chain:
+                    ca_atom = residue.child_dict.get('CA')
+                    if ca_atom is None:
+                        continue
+                    ca_coords.append(ca_atom.coord)
+                    names.append(residue.resname)
+                    ids.append(str(residue.id[1]))
+                chain_data = {
+                    'coords': np.array(ca_coords, dtype=np.float32).reshape(-1, 3),
+                    'names': np.array(names, dtype=object),
+                    'ids': np.array(ids, dtype=object),
+                    'codes': np.array(
+                        [ABBREV_CODE_INDEX.get(res_name, -1) for res_name in names], 
+                        dtype=np.int8
+                    )
+                }
+                self._pair_cache.clear()
+                self._pair_cache[chain_key] = chain_data
+            coords = chain_data['coords']
+            res_names = chain_data['names']
+            res_ids = chain_data['ids']
+            res_code_ids = chain_data['codes']
+            
+            # Reuse the chain's last pair search when it covers every pair needed now
+            pair_cutoff = _pair_cutoff(len(coords), rule_dists, report_all_pairs)
+            pairs: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+            if chain_data.get('pair_cutoff', -1.0) >= pair_cutoff:
+                pair_i, pair_j, distances = chain_data['pairs']
+                if chain_data['pair_cutoff'] > pair_cutoff:
+                    within = distances < pair_cutoff
+                    pair_i, pair_j, distances = pair_i[within], pair_j[within], distances[within]
+                pairs = (pair_i, pair_j, distances)
             
-            # Iterate through all residue pairs
-            for residue1 in chain:
-                for residue2 in chain:
-                    if residue1 != residue2 and residue1 < residue2:
-                        try:
-                            # Calculate CA-CA distance
-                            distance = residue1['CA'] - residue2['CA']
-                        except KeyError:
-                            # Skip if CA atom not found
-                            continue
-                        
-                        # Extract residue information using BioPython methods
-                        res_1_name = residue1.get_resname()
-                        res_2_name = residue2.get_resname()
-                        res_1_id = str(residue1.get_id()[1])
-                        res_2_id = str(residue2.get_id()[1])
-                        
-                        line_data = [res_1_name, res_1_id, res_2_name, res_2_id, distance]
-                        
-                        # Check against each rule
-                        for rule in parsable_rules:
-                            if self._matches_rule(res_1_name, res_2_name, distance, rule):
-                                rule['counter'] += 1
-                                rule['results'].append(line_data[:5])
-                                line_data.append('X')
-                            else:
-                                line_data.append(np.nan)
-                        
-                        final_result_list.append(line_data)
+            # Residue pairs in chain order (all of them, or only those within the
+            # largest rule distance) and the pairs matching each rule
+            pair_i, pair_j, distances, rule_masks = _compute_pairs(
+                coords, res_code_ids, grp1_mask, grp2_mask, rule_dists, all_pairs=report_all_pairs, pairs=pairs
+            )
+            if pairs is None:
+                chain_data['pairs'] = (pair_i, pair_j, distances)
+                chain_data['pair_cutoff'] = pair_cutoff
+            
+            # Results are stored column by column; the DataFrame is built on demand
+            result_columns: List[Union[np.ndarray, pd.api.extensions.ExtensionArray]] = [res_names[pair_i], res_ids[pair_i], res_names[pair_j], res_ids[pair_j], distances]
+            
+            for rule, matches in zip(parsable_rules, rule_masks):
+                rule['counter'] = int(matches.sum())
+                rule['results'] = pd.DataFrame({
+                    column_name: column[matches] for column_name, column in zip(df_columns[:5], result_columns)
+                })
+                # Typed string column ('X' or missing), so pandas does not infer a dtype
+                result_columns.append(pd.array(np.where(matches, 'X', None), dtype=pd.StringDtype()))
             
-            # Create results DataFrame
-            self.parse_results = pd.DataFrame(final_result_list, columns=df_columns)
-            self.parse_results.index += 1
+            self._result_columns = result_columns
+            self._result_column_names = df_columns
             
             # Generate rule summary
             intermediate_rule_summary = 'Matches:\n'
             for rule in parsable_rules:
-                results_df = pd.DataFrame(rule['results'], columns=df_columns[:5])
-                rule['results'] = results_df
                 self.rule_results.append(rule)
                 intermediate_rule_summary += f'{rule["name"]}: {rule["counter"]}\n'
             
             self.rule_summary = intermediate_rule_summary
-            logger.info(f"Parsing complete. Found {len(final_result_list)} residue pairs")
+            logger.info("Parsing complete. Found %s residue pairs", len(distances))
             return True
             
         except (KeyError, IndexError) as e:
-            logger.error(f"Error during parsing: {e}")
+            logger.error("Error during parsing: %s", e)
             return False
     
-    def _matches_rule(self, res1: str, res2: str, distance: float, rule: Dict[str, Any]) -> bool:
-        """Check if a residue pair matches a given rule.
+    @property
+    def parse_results(self) -> Optional[pd.DataFrame]:
+        """Full results table, assembled from the result columns on first access.
         
-        Args:
-            res1: First residue name
-            res2: Second residue name
-            distance: Distance between residues
-            rule: Rule dictionary with groups and distance threshold
-            
-        Returns:
-            True if the pair matches the rule, False otherwise
+        Only the Excel export needs every pair as a DataFrame, so it is not
+        built during parsing.
         """
-        grp1 = rule.get('grp1', [])
-        grp2 = rule.get('grp2', [])
-        max_distance = rule.get('distance', float('inf'))
-        
-        return (
-            (res1 in grp1 and res2 in grp2 and distance < max_distance) or
-            (res1 in grp2 and res2 in grp1 and distance < max_distance)
-        )
+        if self._parse_results is None and self._result_columns is not None:
+            parse_results = pd.DataFrame(dict(enumerate(self._result_columns)))
+            parse_results.columns = self._result_column_names
+            parse_results.index += 1
+            self._parse_results = parse_results
+        return self._parse_results
 
+    def results_preview(self) -> str:
+        """Return the first 50 rows of the results as preformatted text.
+        
+        The table is formatted straight from the result columns once per parse
+        and reused on later calls, so the results page never goes through pandas.
+        
+        Returns:
+            Fixed-width text table, or an empty string if nothing was parsed
+        """
+        if self._result_columns is None:
+            return ''
+        if self._results_preview is None:
+            preview_lines = ['{:>4} {:>9} {:>12} {:>9} {:>12} {:>10}'.format('', *self._result_column_names[:5])]
+            preview_rows = zip(*(column[:50] for column in self._result_columns[:5]))
+            for row_number, (res_1_name, res_1_id, res_2_name, res_2_id, distance) in enumerate(preview_rows, start=1):
+                preview_lines.append(
+                    f'{row_number:>4} {res_1_name:>9} {res_1_id:>12} {res_2_name:>9} {res_2_id:>12} {distance:>10.6f}'
+                )
+            self._results_preview = '\n'.join(preview_lines)
+        return self._results_preview
 
     def save_to_excel(self, excel_name: Union[str, Path]) -> bool:
         """Save parsing results to an Excel file.
         
+        When the results have COMPREHENSIVE_SHEET_MAX_ROWS pairs or more and
+        pyarrow is installed, the full table is saved to a new Parquet file next
+        to the workbook (recorded in full_results_file), and an Overview sheet
+        replaces the Comprehensive sheet. Otherwise tables too large for one
+        sheet are split across numbered sheets.
+        
         Args:
             excel_name: Path to the output Excel file
             
@@ -223,35 +462,162 @@ class ProteinParser:
             logger.error("No filename provided")
             return False
             
+        self.full_results_file = None
+        excel_path = Path(excel_name)
+        
+        # Very large tables go to a Parquet file instead of the Comprehensive sheet;
+        # an existing file is never replaced, the new one gets a numbered name instead
+        num_pairs = len(self.parse_results)
+        if num_pairs >= COMPREHENSIVE_SHEET_MAX_ROWS:
+            parquet_path = excel_path.with_suffix('.parquet')
+            copy_number = 2
+            while parquet_path.exists():
+                parquet_path = excel_path.with_name(f'{excel_path.stem} ({copy_number}).parquet')
+                copy_number += 1
+            if self.save_to_parquet(parquet_path):
+                self.full_results_file = parquet_path
+            
         try:
-            excel_path = Path(excel_name)
+            # constant_memory flushes each row to disk once the next one starts,
+            # so sheets are written row by row rather than with DataFrame.to_excel
             writer = pd.ExcelWriter(
                 excel_path, 
                 engine='xlsxwriter', 
-                engine_kwargs={'options': {'strings_to_numbers': True}}
+                engine_kwargs={'options': {'strings_to_numbers': True, 'constant_memory': True}}
             )
-            
-            # Write comprehensive results
-            self.parse_results.to_excel(
-                excel_writer=writer, 
-                sheet_name='Comprehensive', 
-                freeze_panes=(1, 0), 
-                index=False
+            header_format = writer.book.add_format(
+                {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}
             )
             
-            # Write individual rule results
+            # Write comprehensive results, or an overview pointing to the Parquet file
+            used_sheet_names: Set[str] = set()
+            if self.full_results_file is None:
+                self._write_table(writer.book, 'Comprehensive', self.parse_results, header_format, used_sheet_names)
+            else:
+                overview = writer.book.add_worksheet(_unique_sheet_name('Overview', used_sheet_names))
+                overview.write_row(0, 0, ['Residue pairs', num_pairs])
+                overview.write_row(1, 0, ['Full results', self.full_results_file.name])
+                for row_number, result in enumerate(self.rule_results, start=2):
+                    overview.write_row(row_number, 0, [result['name'], result['counter']])
+            
+            # Write individual rule results; rules sharing a (truncated) name get numbered sheets
             for result in self.rule_results:
-                result['results'].to_excel(
-                    excel_writer=writer, 
-                    sheet_name=result['name'][:31],  # Excel sheet name limit is 31 chars
-                    freeze_panes=(1, 0), 
-                    index=False
-                )
+                self._write_table(writer.book, result['name'], result['results'], header_format, used_sheet_names)
             
             writer.close()
-            logger.info(f"Results saved to {excel_path}")
+            logger.info("Results saved to %s", excel_path)
+            return True
+            
+        except (IOError, PermissionError, ValueError, XlsxWriterException) as e:
+            logger.error("Error saving Excel file: %s", e)
+            return False
+
+    def save_to_parquet(self, parquet_name: Union[str, Path]) -> bool:
+        """Save the full results table to a compressed Parquet file.
+        
+        Requires the optional pyarrow package. Repeated column names (rules
+        sharing a name) are numbered, since Parquet needs unique columns.
+        
+        Args:
+            parquet_name: Path to the output Parquet file
+            
+        Returns:
+            True if save was successful, False otherwise
+        """
+        if self.parse_results is None:
+            logger.error("No results to save")
+            return False
+        
+        if not parquet_name:
+            logger.error("No filename provided")
+            return False
+            
+        column_names: List[str] = []
+        for column_name in self.parse_results.columns:
+            unique_name = column_name
+            copy_number = 2
+            while unique_name in column_names:
+                unique_name = f'{column_name} ({copy_number})'
+                copy_number += 1
+            column_names.append(unique_name)
+            
+        try:
+            parquet_path = Path(parquet_name)
+            self.parse_results.set_axis(column_names, axis=1).to_parquet(
+                parquet_path, engine='pyarrow', compression='zstd', index=False
+            )
+            logger.info("Results saved to %s", parquet_path)
             return True
             
-        except (IOError, PermissionError) as e:
-            logger.error(f"Error saving Excel file: {e}")
-            return False
\ No newline at end of file
+        except ImportError as e:
+            logger.warning("Parquet export unavailable: %s", e)
+            return False
+        except Exception as e:
+            # pyarrow reports conversion problems with its own exception types (ArrowInvalid, ...)
+            logger.error("Error saving Parquet file: %s", e)
+            return False
+
+    def _write_table(
+        self, 
+        workbook: Workbook, 
+        table_name: str, 
+        results: pd.DataFrame, 
+        header_format: Format, 
+        used_sheet_names: Set[str]
+    ) -> None:
+        """Write a results table to one or more worksheets.
+        
+        Tables with more rows than an Excel sheet holds continue on further
+        sheets, named like the first with a " (2)", " (3)", ... suffix, so no
+        rows are dropped.
+        
+        Args:
+            workbook: Workbook to add the worksheets to
+            table_name: Preferred name of the first worksheet
+            results: Table to write, without its index
+            header_format: Cell format of the header rows
+            used_sheet_names: Lower-cased names of the sheets written so far
+        """
+        rows_per_sheet = EXCEL_MAX_ROWS - 1
+        for sheet_start in range(0, max(len(results), 1), rows_per_sheet):
+            self._write_sheet(
+                workbook, 
+                _unique_sheet_name(table_name, used_sheet_names), 
+                results.iloc[sheet_start:sheet_start + rows_per_sheet], 
+                header_format
+            )
+
+    def _write_sheet(
+        self, 
+        workbook: Workbook, 
+        sheet_name: str, 
+        results: pd.DataFrame, 
+        header_format: Format
+    ) -> None:
+        """Write a results table to a new worksheet in row order.
+        
+        Rows are converted in blocks, with missing values written as blank cells.
+        xlsxwriter skips rows past the sheet limit without raising, so a table
+        that does not fit is refused rather than written incompletely.
+        
+        Args:
+            workbook: Workbook to add the worksheet to
+            sheet_name: Name of the new worksheet
+            results: Table to write, without its index
+            header_format: Cell format of the header row
+            
+        Raises:
+            ValueError: If the table has more rows than an Excel sheet holds
+        """
+        if len(results) + 1 > EXCEL_MAX_ROWS:
+            raise ValueError(f"Sheet '{sheet_name}' needs {len(results) + 1} rows; Excel allows {EXCEL_MAX_ROWS}")
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.freeze_panes(1, 0)
+        worksheet.write_row(0, 0, results.columns.tolist(), header_format)
+        
+        for block_start in range(0, len(results), EXCEL_WRITE_BLOCK_ROWS):
+            block = results.iloc[block_start:block_start + EXCEL_WRITE_BLOCK_ROWS]
+            block = block.astype(object).where(block.notna(), None)
+            for row_number, row in enumerate(block.itertuples(index=False, name=None), start=block_start + 1):
+                if worksheet.write_row(row_number, 0, row) == -1:
+                    raise ValueError(f"Row {row_number + 1} of sheet '{sheet_name}' is outside the Excel sheet limits")
\ No newline at end of file